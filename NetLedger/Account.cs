@@ -46,7 +46,7 @@ namespace NetLedger
         /// </summary>
         [JsonProperty(Order = 999)]
         [Column("createdutc", false, DataTypes.DateTime, false)]
-        public DateTime CreatedUtc { get; set; } = DateTime.Now.ToUniversalTime();
+        public DateTime CreatedUtc { get; set; } = DateTime.UtcNow;
 
         #endregion
 
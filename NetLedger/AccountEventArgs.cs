@@ -34,7 +34,7 @@ namespace NetLedger
         /// <summary>
         /// UTC timestamp when the account was created.
         /// </summary> 
-        public DateTime CreatedUtc { get; private set; } = DateTime.Now.ToUniversalTime();
+        public DateTime CreatedUtc { get; private set; } = DateTime.UtcNow;
 
         #endregion
 
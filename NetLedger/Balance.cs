@@ -29,13 +29,13 @@ namespace NetLedger
         /// UTC timestamp when the account was created.
         /// </summary>
         [JsonProperty(Order = -6)]
-        public DateTime CreatedUtc { get; set; } = DateTime.Now.ToUniversalTime();
+        public DateTime CreatedUtc { get; set; } = DateTime.UtcNow;
 
         /// <summary>
         /// UTC timestamp when the most recent balance was calculated.
         /// </summary>
         [JsonProperty(Order = -5)]
-        public DateTime BalanceTimestampUtc { get; set; } = DateTime.Now.ToUniversalTime();
+        public DateTime BalanceTimestampUtc { get; set; } = DateTime.UtcNow;
 
         /// <summary>
         /// Committed balance available in the account.
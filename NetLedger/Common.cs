@@ -6,7 +6,13 @@ using Newtonsoft.Json;
 namespace NetLedger
 {
     internal static class Common
-    { 
+    {
+        private static readonly JsonSerializerSettings _JsonSettings = new JsonSerializerSettings
+        {
+            NullValueHandling = NullValueHandling.Ignore,
+            DateTimeZoneHandling = DateTimeZoneHandling.Utc
+        };
+
         internal static List<string> CsvToStringList(string csv)
         {
             if (String.IsNullOrEmpty(csv))
@@ -33,54 +39,14 @@ namespace NetLedger
         internal static string StringListToCsv(List<string> strings)
         {
             if (strings == null || strings.Count < 1) return null;
-
-            int added = 0;
-            string ret = "";
-
-            foreach (string curr in strings)
-            {
-                if (added == 0)
-                {
-                    ret += curr;
-                }
-                else
-                {
-                    ret += "," + curr;
-                }
-
-                added++;
-            }
-
-            return ret;
+            return String.Join(",", strings);
         }
 
         internal static string SerializeJson(object obj, bool pretty)
         {
             if (obj == null) return null;
-            string json;
-
-            if (pretty)
-            {
-                json = JsonConvert.SerializeObject(
-                  obj,
-                  Newtonsoft.Json.Formatting.Indented,
-                  new JsonSerializerSettings
-                  {
-                      NullValueHandling = NullValueHandling.Ignore,
-                      DateTimeZoneHandling = DateTimeZoneHandling.Utc,
-                  });
-            }
-            else
-            {
-                json = JsonConvert.SerializeObject(obj,
-                  new JsonSerializerSettings
-                  {
-                      NullValueHandling = NullValueHandling.Ignore,
-                      DateTimeZoneHandling = DateTimeZoneHandling.Utc
-                  });
-            }
-
-            return json;
+            if (pretty) return JsonConvert.SerializeObject(obj, Newtonsoft.Json.Formatting.Indented, _JsonSettings);
+            return JsonConvert.SerializeObject(obj, _JsonSettings);
         }
 
         internal static T DeserializeJson<T>(string json)
@@ -33,7 +33,7 @@ namespace NetLedger
         /// </summary>
         [JsonProperty(Order = -3)]
         [Column("accountguid", false, DataTypes.Nvarchar, 64, false)]
-        public string AccountGUID { get; set; } = Guid.NewGuid().ToString();
+        public string AccountGUID { get; set; } = null;
 
         /// <summary>
         /// The type of entry.
@@ -88,7 +88,7 @@ namespace NetLedger
         /// </summary>
         [JsonProperty(Order = 999)]
         [Column("createdutc", false, DataTypes.DateTime, false)]
-        public DateTime CreatedUtc { get; set; } = DateTime.Now.ToUniversalTime();
+        public DateTime CreatedUtc { get; set; } = DateTime.UtcNow;
 
         #endregion
 
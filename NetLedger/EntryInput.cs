@@ -0,0 +1,63 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Text;
+
+namespace NetLedger
+{
+    /// <summary>
+    /// A credit or debit to be added to an account.
+    /// </summary>
+    public class EntryInput
+    {
+        #region Public-Members
+
+        /// <summary>
+        /// The amount/value of the entry (zero or greater).
+        /// </summary>
+        public decimal Amount { get; set; } = 0m;
+
+        /// <summary>
+        /// Notes for the entry.
+        /// </summary>
+        public string Notes { get; set; } = null;
+
+        #endregion
+
+        #region Private-Members
+
+        #endregion
+
+        #region Constructors-and-Factories
+
+        /// <summary>
+        /// Instantiate an entry input.
+        /// </summary>
+        public EntryInput()
+        {
+
+        }
+
+        /// <summary>
+        /// Instantiate an entry input.
+        /// </summary>
+        /// <param name="amount">Amount/value (zero or greater).</param>
+        /// <param name="notes">Notes for the entry.</param>
+        public EntryInput(decimal amount, string notes = null)
+        {
+            if (amount < 0) throw new ArgumentException("Amount must be zero or greater.");
+
+            Amount = amount;
+            Notes = notes;
+        }
+
+        #endregion
+
+        #region Public-Methods
+
+        #endregion
+
+        #region Private-Methods
+
+        #endregion
+    }
+}
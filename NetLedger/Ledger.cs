@@ -50,11 +50,31 @@ namespace NetLedger
 
         #region Private-Members
 
+        private const int _LockRetryMinimumMs = 1;
+        private const int _LockRetryMaximumMs = 100;
+
         private string _DatabaseFile = null;
         private DatabaseSettings _DatabaseSettings = null;
         private WatsonORM _ORM = null; 
         private ConcurrentDictionary<string, DateTime> _LockedAccounts = new ConcurrentDictionary<string, DateTime>();
 
+        private string _AccountNameColumn = null;
+        private string _AccountGUIDColumn = null;
+        private string _AccountCreatedUtcColumn = null;
+        private string _AccountIdColumn = null;
+        private string _EntryAccountGUIDColumn = null;
+        private string _EntryIsCommittedColumn = null;
+        private string _EntryCommittedUtcColumn = null;
+        private string _EntryGUIDColumn = null;
+        private string _EntryTypeColumn = null;
+        private string _EntryCreatedUtcColumn = null;
+        private string _EntryDescriptionColumn = null;
+        private string _EntryAmountColumn = null;
+        private string _EntryIdColumn = null;
+
+        private DbResultOrder[] _AccountsNewestFirst = null;
+        private DbResultOrder[] _EntriesNewestFirst = null;
+
         #endregion
 
         #region Constructors-and-Factories
@@ -73,6 +93,32 @@ namespace NetLedger
             _ORM.InitializeDatabase();
             _ORM.InitializeTable(typeof(Account));
             _ORM.InitializeTable(typeof(Entry));
+
+            _AccountNameColumn = _ORM.GetColumnName<Account>(nameof(Account.Name));
+            _AccountGUIDColumn = _ORM.GetColumnName<Account>(nameof(Account.GUID));
+            _AccountCreatedUtcColumn = _ORM.GetColumnName<Account>(nameof(Account.CreatedUtc));
+            _AccountIdColumn = _ORM.GetColumnName<Account>(nameof(Account.Id));
+            _EntryAccountGUIDColumn = _ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID));
+            _EntryIsCommittedColumn = _ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted));
+            _EntryCommittedUtcColumn = _ORM.GetColumnName<Entry>(nameof(Entry.CommittedUtc));
+            _EntryGUIDColumn = _ORM.GetColumnName<Entry>(nameof(Entry.GUID));
+            _EntryTypeColumn = _ORM.GetColumnName<Entry>(nameof(Entry.Type));
+            _EntryCreatedUtcColumn = _ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc));
+            _EntryDescriptionColumn = _ORM.GetColumnName<Entry>(nameof(Entry.Description));
+            _EntryAmountColumn = _ORM.GetColumnName<Entry>(nameof(Entry.Amount));
+            _EntryIdColumn = _ORM.GetColumnName<Entry>(nameof(Entry.Id));
+
+            _AccountsNewestFirst = new DbResultOrder[]
+            {
+                new DbResultOrder(_AccountCreatedUtcColumn, DbOrderDirection.Descending),
+                new DbResultOrder(_AccountIdColumn, DbOrderDirection.Descending)
+            };
+
+            _EntriesNewestFirst = new DbResultOrder[]
+            {
+                new DbResultOrder(_EntryCreatedUtcColumn, DbOrderDirection.Descending),
+                new DbResultOrder(_EntryIdColumn, DbOrderDirection.Descending)
+            };
         }
 
         #endregion
@@ -96,7 +142,6 @@ namespace NetLedger
                 LockAccount(a.GUID);
 
                 Entry balance = new Entry();
-                balance.GUID = Guid.NewGuid().ToString();
                 balance.AccountGUID = a.GUID;
                 balance.Type = EntryType.Balance;
 
@@ -107,7 +152,7 @@ namespace NetLedger
                 balance.SummarizedGUIDs = null;
                 balance.IsCommitted = true;
 
-                DateTime ts = DateTime.Now.ToUniversalTime();
+                DateTime ts = DateTime.UtcNow;
                 balance.CreatedUtc = ts;
                 balance.CommittedUtc = ts;
                 balance = _ORM.Insert<Entry>(balance);
@@ -128,23 +173,9 @@ namespace NetLedger
         public void DeleteAccountByName(string name)
         {
             if (String.IsNullOrEmpty(name)) throw new ArgumentNullException(nameof(name));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.Name)), DbOperators.Equals, name);
+            DbExpression e1 = new DbExpression(_AccountNameColumn, DbOperators.Equals, name);
             Account a = _ORM.SelectFirst<Account>(e1);
-            if (a != null)
-            {
-                try
-                {
-                    LockAccount(a.GUID);
-                    DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, a.GUID);
-                    _ORM.DeleteMany<Entry>(e2);
-                    _ORM.Delete<Account>(a);
-                }
-                finally
-                {
-                    UnlockAccount(a.GUID);
-                    Task.Run(() => AccountDeleted?.Invoke(this, new AccountEventArgs(a)));
-                }
-            }
+            if (a != null) DeleteAccount(a);
         }
 
         /// <summary>
@@ -154,23 +185,9 @@ namespace NetLedger
         public void DeleteAccountByGuid(string guid)
         {
             if (String.IsNullOrEmpty(guid)) throw new ArgumentNullException(nameof(guid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, guid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, guid);
             Account a = _ORM.SelectFirst<Account>(e1);
-            if (a != null)
-            {
-                try
-                {
-                    LockAccount(a.GUID);
-                    DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, a.GUID);
-                    _ORM.DeleteMany<Entry>(e2);
-                    _ORM.Delete<Account>(a);
-                }
-                finally
-                {
-                    UnlockAccount(a.GUID);
-                    Task.Run(() => AccountDeleted?.Invoke(this, new AccountEventArgs(a)));
-                }
-            }
+            if (a != null) DeleteAccount(a);
         }
 
         /// <summary>
@@ -181,7 +198,7 @@ namespace NetLedger
         public Account GetAccountByName(string name)
         {
             if (String.IsNullOrEmpty(name)) throw new ArgumentNullException(nameof(name));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.Name)), DbOperators.Equals, name);
+            DbExpression e1 = new DbExpression(_AccountNameColumn, DbOperators.Equals, name);
             return _ORM.SelectFirst<Account>(e1);
         }
 
@@ -193,7 +210,7 @@ namespace NetLedger
         public Account GetAccountByGuid(string guid)
         {
             if (String.IsNullOrEmpty(guid)) throw new ArgumentNullException(nameof(guid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, guid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, guid);
             return _ORM.SelectFirst<Account>(e1);
         }
 
@@ -204,11 +221,21 @@ namespace NetLedger
         /// <returns>List of Account objects.</returns>
         public List<Account> GetAllAccounts(string searchTerm = null)
         {
-            DbResultOrder[] ro = new DbResultOrder[1];
-            ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Account.CreatedUtc)), DbOrderDirection.Descending);
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.Id)), DbOperators.GreaterThan, 0);
-            if (!String.IsNullOrEmpty(searchTerm)) e1.PrependAnd(_ORM.GetColumnName<Account>(nameof(Account.Name)), DbOperators.Contains, searchTerm);
-            return _ORM.SelectMany<Account>(null, null, e1, ro);
+            return SelectAccounts(searchTerm, null, null);
+        }
+
+        /// <summary>
+        /// Retrieve one page of accounts.
+        /// </summary>
+        /// <param name="searchTerm">Term to search within account names.</param>
+        /// <param name="startIndex">Number of matching accounts to skip (zero or greater).</param>
+        /// <param name="maxResults">Maximum number of accounts to return (greater than zero).</param>
+        /// <returns>List of Account objects.</returns>
+        public List<Account> GetAllAccounts(string searchTerm, int startIndex, int maxResults)
+        {
+            if (startIndex < 0) throw new ArgumentException("Start index must be zero or greater.");
+            if (maxResults < 1) throw new ArgumentException("Maximum results must be greater than zero.");
+            return SelectAccounts(searchTerm, startIndex, maxResults);
         }
 
         #endregion
@@ -225,26 +252,7 @@ namespace NetLedger
         /// <returns>String containing the GUID of the newly-created entry.</returns>
         public string AddCredit(string accountGuid, decimal amount, string notes = null, bool isCommitted = false)
         {
-            if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            if (amount < 0) throw new ArgumentException("Amount must be zero or greater.");
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
-            Account a = _ORM.SelectFirst<Account>(e1);
-            if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
-
-            Entry entry = null;
-
-            try
-            {
-                LockAccount(accountGuid);
-                entry = new Entry(accountGuid, EntryType.Credit, amount, notes, null, isCommitted);
-                entry = _ORM.Insert<Entry>(entry);
-                return entry.GUID;
-            }
-            finally
-            {
-                UnlockAccount(accountGuid);
-                if (entry != null) Task.Run(() => CreditAdded?.Invoke(this, new EntryEventArgs(a, entry)));
-            }
+            return AddCredits(accountGuid, new List<EntryInput> { new EntryInput { Amount = amount, Notes = notes } }, isCommitted)[0];
         }
 
         /// <summary>
@@ -257,26 +265,35 @@ namespace NetLedger
         /// <returns>String containing the GUID of the newly-created entry.</returns>
         public string AddDebit(string accountGuid, decimal amount, string notes = null, bool isCommitted = false)
         {
-            if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            if (amount < 0) throw new ArgumentException("Amount must be zero or greater.");
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
-            Account a = _ORM.SelectFirst<Account>(e1);
-            if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
+            return AddDebits(accountGuid, new List<EntryInput> { new EntryInput { Amount = amount, Notes = notes } }, isCommitted)[0];
+        }
 
-            Entry entry = null;
+        /// <summary>
+        /// Add multiple credits.
+        /// If any insert fails, credits already inserted by this call are removed and the exception is rethrown.
+        /// If that removal also fails, an AggregateException containing both exceptions is thrown and the inserted credits may remain pending.
+        /// </summary>
+        /// <param name="accountGuid">GUID of the account.</param>
+        /// <param name="credits">Amounts and notes of the credits (each amount zero or greater).</param>
+        /// <param name="isCommitted">Indicates if the transactions have already been commited to the current committed balance.</param>
+        /// <returns>List of GUIDs of the newly-created entries, in the order the credits were supplied.</returns>
+        public List<string> AddCredits(string accountGuid, List<EntryInput> credits, bool isCommitted = false)
+        {
+            return AddEntries(accountGuid, EntryType.Credit, credits, isCommitted);
+        }
 
-            try
-            {
-                LockAccount(accountGuid);
-                entry = new Entry(accountGuid, EntryType.Debit, amount, notes, null, isCommitted);
-                entry = _ORM.Insert<Entry>(entry);
-                return entry.GUID;
-            }
-            finally
-            {
-                UnlockAccount(accountGuid);
-                if (entry != null) Task.Run(() => DebitAdded?.Invoke(this, new EntryEventArgs(a, entry)));
-            }
+        /// <summary>
+        /// Add multiple debits.
+        /// If any insert fails, debits already inserted by this call are removed and the exception is rethrown.
+        /// If that removal also fails, an AggregateException containing both exceptions is thrown and the inserted debits may remain pending.
+        /// </summary>
+        /// <param name="accountGuid">GUID of the account.</param>
+        /// <param name="debits">Amounts and notes of the debits (each amount zero or greater).</param>
+        /// <param name="isCommitted">Indicates if the transactions have already been commited to the current committed balance.</param>
+        /// <returns>List of GUIDs of the newly-created entries, in the order the debits were supplied.</returns>
+        public List<string> AddDebits(string accountGuid, List<EntryInput> debits, bool isCommitted = false)
+        {
+            return AddEntries(accountGuid, EntryType.Debit, debits, isCommitted);
         }
 
         /// <summary>
@@ -289,7 +306,7 @@ namespace NetLedger
         {
             if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
             if (String.IsNullOrEmpty(entryGuid)) throw new ArgumentNullException(nameof(entryGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
             Account a = _ORM.SelectFirst<Account>(e1);
             if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
 
@@ -298,10 +315,10 @@ namespace NetLedger
             try
             {
                 LockAccount(accountGuid);
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted)), DbOperators.Equals, false);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CommittedUtc)), DbOperators.IsNull, null);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.GUID)), DbOperators.Equals, entryGuid);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e2.PrependAnd(_EntryIsCommittedColumn, DbOperators.Equals, false);
+                e2.PrependAnd(_EntryCommittedUtcColumn, DbOperators.IsNull, null);
+                e2.PrependAnd(_EntryGUIDColumn, DbOperators.Equals, entryGuid);
                 entry = _ORM.SelectFirst<Entry>(e2);
                 if (entry == null) throw new KeyNotFoundException("Unable to find pending entry with GUID " + entryGuid + ".");
 
@@ -323,7 +340,7 @@ namespace NetLedger
         public Balance GetBalance(string accountGuid, bool applyLock = true)
         {
             if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
             Account a = _ORM.SelectFirst<Account>(e1);
             if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
 
@@ -333,12 +350,10 @@ namespace NetLedger
                 Balance balance = new Balance();
 
                 // Get current balance
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Type)), DbOperators.Equals, EntryType.Balance);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e2.PrependAnd(_EntryTypeColumn, DbOperators.Equals, EntryType.Balance);
 
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
-                List<Entry> balanceEntries = _ORM.SelectMany<Entry>(null, 1, e2, ro);
+                List<Entry> balanceEntries = _ORM.SelectMany<Entry>(null, 1, e2, _EntriesNewestFirst);
 
                 Entry balanceEntry = null;
                 if (balanceEntries != null && balanceEntries.Count > 0) balanceEntry = balanceEntries[0];
@@ -348,9 +363,9 @@ namespace NetLedger
                 balance.CommittedBalance = balanceEntry.Amount;
             
                 // Get pending transactions
-                DbExpression e3 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e3.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted)), DbOperators.Equals, false);
-                List<Entry> pendingEntries = _ORM.SelectMany<Entry>(null, null, e3, ro);
+                DbExpression e3 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e3.PrependAnd(_EntryIsCommittedColumn, DbOperators.Equals, false);
+                List<Entry> pendingEntries = _ORM.SelectMany<Entry>(null, null, e3, _EntriesNewestFirst);
 
                 if (pendingEntries != null && pendingEntries.Count > 0)
                 {
@@ -389,20 +404,18 @@ namespace NetLedger
         public List<Entry> GetPendingEntries(string accountGuid)
         {
             if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
             Account a = _ORM.SelectFirst<Account>(e1);
             if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
 
             try
             {
                 LockAccount(accountGuid);
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted)), DbOperators.Equals, false);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CommittedUtc)), DbOperators.IsNull, null);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e2.PrependAnd(_EntryIsCommittedColumn, DbOperators.Equals, false);
+                e2.PrependAnd(_EntryCommittedUtcColumn, DbOperators.IsNull, null);
 
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
-                return _ORM.SelectMany<Entry>(null, null, e2, ro);
+                return _ORM.SelectMany<Entry>(null, null, e2, _EntriesNewestFirst);
             }
             finally
             {
@@ -418,21 +431,19 @@ namespace NetLedger
         public List<Entry> GetPendingCredits(string accountGuid)
         {
             if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
             Account a = _ORM.SelectFirst<Account>(e1);
             if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
 
             try
             {
                 LockAccount(accountGuid);
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted)), DbOperators.Equals, false);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CommittedUtc)), DbOperators.IsNull, null);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Type)), DbOperators.Equals, EntryType.Credit);
-
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
-                return _ORM.SelectMany<Entry>(null, null, e2, ro);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e2.PrependAnd(_EntryIsCommittedColumn, DbOperators.Equals, false);
+                e2.PrependAnd(_EntryCommittedUtcColumn, DbOperators.IsNull, null);
+                e2.PrependAnd(_EntryTypeColumn, DbOperators.Equals, EntryType.Credit);
+
+                return _ORM.SelectMany<Entry>(null, null, e2, _EntriesNewestFirst);
             }
             finally
             {
@@ -448,21 +459,19 @@ namespace NetLedger
         public List<Entry> GetPendingDebits(string accountGuid)
         {
             if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
             Account a = _ORM.SelectFirst<Account>(e1);
             if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
 
             try
             {
                 LockAccount(accountGuid);
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.IsCommitted)), DbOperators.Equals, false);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CommittedUtc)), DbOperators.IsNull, null);
-                e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Type)), DbOperators.Equals, EntryType.Debit);
-
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
-                return _ORM.SelectMany<Entry>(null, null, e2, ro);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e2.PrependAnd(_EntryIsCommittedColumn, DbOperators.Equals, false);
+                e2.PrependAnd(_EntryCommittedUtcColumn, DbOperators.IsNull, null);
+                e2.PrependAnd(_EntryTypeColumn, DbOperators.Equals, EntryType.Debit);
+
+                return _ORM.SelectMany<Entry>(null, null, e2, _EntriesNewestFirst);
             }
             finally
             {
@@ -489,40 +498,35 @@ namespace NetLedger
             decimal? amountMin = null,
             decimal? amountMax = null)
         {
-            if (startTimeUtc != null && endTimeUtc != null)
-            {
-                if (DateTime.Compare(Convert.ToDateTime(endTimeUtc), Convert.ToDateTime(startTimeUtc)) < 0)
-                {
-                    throw new ArgumentException("Specified end time must be later than the specified start time.");
-                }
-            }
-
-            if (amountMin != null && amountMin.Value < 0) throw new ArgumentException("Minimum amount must be zero or greater.");
-            if (amountMax != null && amountMax.Value < 0) throw new ArgumentException("Maximum amount must be zero or greater.");
-
-            if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
-            DbExpression e1 = new DbExpression(_ORM.GetColumnName<Account>(nameof(Account.GUID)), DbOperators.Equals, accountGuid);
-            Account a = _ORM.SelectFirst<Account>(e1);
-            if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
+            return SelectEntries(accountGuid, startTimeUtc, endTimeUtc, searchTerm, entryType, amountMin, amountMax, null, null);
+        }
 
-            try
-            {
-                LockAccount(accountGuid);
-                DbExpression e2 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                if (startTimeUtc != null) e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOperators.GreaterThanOrEqualTo, startTimeUtc.Value);
-                if (endTimeUtc != null) e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOperators.LessThanOrEqualTo, endTimeUtc.Value);
-                if (!String.IsNullOrEmpty(searchTerm)) e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Description)), DbOperators.Contains, searchTerm);
-                if (amountMin != null) e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Amount)), DbOperators.GreaterThanOrEqualTo, amountMin.Value);
-                if (amountMax != null) e2.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Amount)), DbOperators.LessThanOrEqualTo, amountMax.Value);
-
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
-                return _ORM.SelectMany<Entry>(null, null, e2, ro);
-            }
-            finally
-            {
-                UnlockAccount(accountGuid);
-            }
+        /// <summary>
+        /// Retrieve one page of entries matching the specified conditions.
+        /// </summary>
+        /// <param name="accountGuid">GUID of the account.</param>
+        /// <param name="startIndex">Number of matching entries to skip (zero or greater).</param>
+        /// <param name="maxResults">Maximum number of entries to return (greater than zero).</param>
+        /// <param name="startTimeUtc">Start time UTC.</param>
+        /// <param name="endTimeUtc">End time UTC.</param>
+        /// <param name="searchTerm">Search term that must appear in the entry description.</param>
+        /// <param name="entryType">The type of entry.</param>
+        /// <param name="amountMin">Minimum amount.</param>
+        /// <param name="amountMax">Maximum amount.</param>
+        /// <returns>List of matching entries.</returns>
+        public List<Entry> GetEntries(string accountGuid,
+            int startIndex,
+            int maxResults,
+            DateTime? startTimeUtc = null,
+            DateTime? endTimeUtc = null,
+            string searchTerm = null,
+            EntryType? entryType = null,
+            decimal? amountMin = null,
+            decimal? amountMax = null)
+        {
+            if (startIndex < 0) throw new ArgumentException("Start index must be zero or greater.");
+            if (maxResults < 1) throw new ArgumentException("Maximum results must be greater than zero.");
+            return SelectEntries(accountGuid, startTimeUtc, endTimeUtc, searchTerm, entryType, amountMin, amountMax, startIndex, maxResults);
         }
 
         #endregion
@@ -543,7 +547,7 @@ namespace NetLedger
             Account account = null;
             Balance balanceBefore = null;
             Balance balanceAfter = null;
-            List<string> summarized = new List<string>();
+            List<string> summarized = null;
 
             try
             {
@@ -554,23 +558,25 @@ namespace NetLedger
 
                 // get current balance
                 balanceBefore = GetBalance(accountGuid, false);
+                summarized = new List<string>(balanceBefore.PendingCredits.Count + balanceBefore.PendingDebits.Count);
                  
                 // get old balance entry
-                DbExpression e1 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                e1.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.Type)), DbOperators.Equals, EntryType.Balance);
-
-                DbResultOrder[] ro = new DbResultOrder[1];
-                ro[0] = new DbResultOrder(_ORM.GetColumnName<Entry>(nameof(Entry.CreatedUtc)), DbOrderDirection.Descending);
+                DbExpression e1 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                e1.PrependAnd(_EntryTypeColumn, DbOperators.Equals, EntryType.Balance);
 
-                List<Entry> previousBalanceEntries = _ORM.SelectMany<Entry>(null, 1, e1, ro);
+                List<Entry> previousBalanceEntries = _ORM.SelectMany<Entry>(null, 1, e1, _EntriesNewestFirst);
                 if (previousBalanceEntries == null || previousBalanceEntries.Count != 1) throw new InvalidOperationException("No balance entry found for account with GUID " + accountGuid + ".");
                 Entry balanceOld = previousBalanceEntries[0]; 
 
                 // validate requested GUIDs
+                HashSet<string> requestedGuids = null;
+
                 if (guids != null && guids.Count > 0)
                 {
-                    DbExpression e3 = new DbExpression(_ORM.GetColumnName<Entry>(nameof(Entry.AccountGUID)), DbOperators.Equals, accountGuid);
-                    e3.PrependAnd(_ORM.GetColumnName<Entry>(nameof(Entry.GUID)), DbOperators.In, guids);
+                    requestedGuids = new HashSet<string>(guids);
+
+                    DbExpression e3 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                    e3.PrependAnd(_EntryGUIDColumn, DbOperators.In, guids);
                     List<Entry> requestedEntries = _ORM.SelectMany<Entry>(e3);
                     if (requestedEntries == null || requestedEntries.Count < 1) throw new KeyNotFoundException("One or more requested entries to commit were not found.");
 
@@ -592,25 +598,30 @@ namespace NetLedger
                         }
                     }
 
+                    HashSet<string> foundGuids = new HashSet<string>(requestedEntries.Select(e => e.GUID));
+
                     foreach (string guid in guids)
                     {
-                        if (!requestedEntries.Any(e => e.GUID.Equals(guid)))
+                        if (!foundGuids.Contains(guid))
                         {
                             throw new KeyNotFoundException("No entry found with GUID " + guid + ".");
                         }
                     }
                 }
                  
+                // single commit timestamp for all committed entries and the new balance entry
+                DateTime ts = DateTime.UtcNow;
+
                 // commit credits
                 decimal committedCreditsTotal = 0m;
                 if (balanceBefore.PendingCredits.Entries != null && balanceBefore.PendingCredits.Entries.Count > 0)
                 {
                     foreach (Entry entry in balanceBefore.PendingCredits.Entries)
                     {
-                        if (guids != null && guids.Count > 0 && !guids.Contains(entry.GUID)) continue;
+                        if (requestedGuids != null && !requestedGuids.Contains(entry.GUID)) continue;
                         summarized.Add(entry.GUID);
                         entry.IsCommitted = true;
-                        entry.CommittedUtc = DateTime.Now.ToUniversalTime(); 
+                        entry.CommittedUtc = ts;
                         _ORM.Update<Entry>(entry);
                         committedCreditsTotal += entry.Amount;
                     }
@@ -622,10 +633,10 @@ namespace NetLedger
                 {
                     foreach (Entry entry in balanceBefore.PendingDebits.Entries)
                     {
-                        if (guids != null && guids.Count > 0 && !guids.Contains(entry.GUID)) continue;
+                        if (requestedGuids != null && !requestedGuids.Contains(entry.GUID)) continue;
                         summarized.Add(entry.GUID);
                         entry.IsCommitted = true;
-                        entry.CommittedUtc = DateTime.Now.ToUniversalTime(); 
+                        entry.CommittedUtc = ts;
                         _ORM.Update<Entry>(entry);
                         committedDebitsTotal += entry.Amount;
                     }
@@ -633,7 +644,6 @@ namespace NetLedger
 
                 // create new balance entry
                 Entry balanceNew = new Entry();
-                balanceNew.GUID = Guid.NewGuid().ToString();
                 balanceNew.AccountGUID = accountGuid;
                 balanceNew.Type = EntryType.Balance;
                 balanceNew.Amount = balanceBefore.CommittedBalance + committedCreditsTotal - committedDebitsTotal;
@@ -641,7 +651,6 @@ namespace NetLedger
                 balanceNew.SummarizedGUIDs = Common.StringListToCsv(summarized);
                 balanceNew.IsCommitted = true;
                 balanceNew.Replaces = balanceOld.GUID;
-                DateTime ts = DateTime.Now.ToUniversalTime();
                 balanceNew.CreatedUtc = ts;
                 balanceNew.CommittedUtc = ts;
                 balanceNew = _ORM.Insert<Entry>(balanceNew);
@@ -663,11 +672,144 @@ namespace NetLedger
 
         #region Private-Methods
 
+        private List<Account> SelectAccounts(string searchTerm, int? startIndex, int? maxResults)
+        {
+            DbExpression e1 = new DbExpression(_AccountIdColumn, DbOperators.GreaterThan, 0);
+            if (!String.IsNullOrEmpty(searchTerm)) e1.PrependAnd(_AccountNameColumn, DbOperators.Contains, searchTerm);
+            return _ORM.SelectMany<Account>(startIndex, maxResults, e1, _AccountsNewestFirst);
+        }
+
+        private List<Entry> SelectEntries(string accountGuid,
+            DateTime? startTimeUtc,
+            DateTime? endTimeUtc,
+            string searchTerm,
+            EntryType? entryType,
+            decimal? amountMin,
+            decimal? amountMax,
+            int? startIndex,
+            int? maxResults)
+        {
+            if (startTimeUtc != null && endTimeUtc != null)
+            {
+                if (DateTime.Compare(Convert.ToDateTime(endTimeUtc), Convert.ToDateTime(startTimeUtc)) < 0)
+                {
+                    throw new ArgumentException("Specified end time must be later than the specified start time.");
+                }
+            }
+
+            if (amountMin != null && amountMin.Value < 0) throw new ArgumentException("Minimum amount must be zero or greater.");
+            if (amountMax != null && amountMax.Value < 0) throw new ArgumentException("Maximum amount must be zero or greater.");
+
+            if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
+            Account a = _ORM.SelectFirst<Account>(e1);
+            if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
+
+            try
+            {
+                LockAccount(accountGuid);
+                DbExpression e2 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, accountGuid);
+                if (startTimeUtc != null) e2.PrependAnd(_EntryCreatedUtcColumn, DbOperators.GreaterThanOrEqualTo, startTimeUtc.Value);
+                if (endTimeUtc != null) e2.PrependAnd(_EntryCreatedUtcColumn, DbOperators.LessThanOrEqualTo, endTimeUtc.Value);
+                if (!String.IsNullOrEmpty(searchTerm)) e2.PrependAnd(_EntryDescriptionColumn, DbOperators.Contains, searchTerm);
+                if (amountMin != null) e2.PrependAnd(_EntryAmountColumn, DbOperators.GreaterThanOrEqualTo, amountMin.Value);
+                if (entryType != null) e2.PrependAnd(_EntryTypeColumn, DbOperators.Equals, entryType.Value);
+                if (amountMax != null) e2.PrependAnd(_EntryAmountColumn, DbOperators.LessThanOrEqualTo, amountMax.Value);
+
+                return _ORM.SelectMany<Entry>(startIndex, maxResults, e2, _EntriesNewestFirst);
+            }
+            finally
+            {
+                UnlockAccount(accountGuid);
+            }
+        }
+
+        private void DeleteAccount(Account a)
+        {
+            try
+            {
+                LockAccount(a.GUID);
+                DbExpression e1 = new DbExpression(_EntryAccountGUIDColumn, DbOperators.Equals, a.GUID);
+                _ORM.DeleteMany<Entry>(e1);
+                _ORM.Delete<Account>(a);
+            }
+            finally
+            {
+                UnlockAccount(a.GUID);
+                Task.Run(() => AccountDeleted?.Invoke(this, new AccountEventArgs(a)));
+            }
+        }
+
+        private List<string> AddEntries(string accountGuid, EntryType entryType, List<EntryInput> inputs, bool isCommitted)
+        {
+            if (String.IsNullOrEmpty(accountGuid)) throw new ArgumentNullException(nameof(accountGuid));
+            if (inputs == null || inputs.Count < 1) throw new ArgumentNullException(nameof(inputs));
+            foreach (EntryInput input in inputs)
+            {
+                if (input == null) throw new ArgumentNullException(nameof(inputs));
+                if (input.Amount < 0) throw new ArgumentException("Amount must be zero or greater.");
+            }
+
+            DbExpression e1 = new DbExpression(_AccountGUIDColumn, DbOperators.Equals, accountGuid);
+            Account a = _ORM.SelectFirst<Account>(e1);
+            if (a == null) throw new KeyNotFoundException("Unable to find account with GUID " + accountGuid + ".");
+
+            List<Entry> entries = new List<Entry>(inputs.Count);
+
+            try
+            {
+                LockAccount(a.GUID);
+
+                try
+                {
+                    foreach (EntryInput input in inputs)
+                    {
+                        Entry entry = new Entry(a.GUID, entryType, input.Amount, input.Notes, null, isCommitted);
+                        entries.Add(_ORM.Insert<Entry>(entry));
+                    }
+                }
+                catch (Exception insertException)
+                {
+                    if (entries.Count > 0)
+                    {
+                        DbExpression e2 = new DbExpression(_EntryGUIDColumn, DbOperators.In, entries.Select(e => e.GUID).ToList());
+                        entries.Clear();
+
+                        try
+                        {
+                            _ORM.DeleteMany<Entry>(e2);
+                        }
+                        catch (Exception cleanupException)
+                        {
+                            throw new AggregateException("Unable to remove entries inserted before the failure.", insertException, cleanupException);
+                        }
+                    }
+
+                    throw;
+                }
+
+                return entries.Select(e => e.GUID).ToList();
+            }
+            finally
+            {
+                UnlockAccount(a.GUID);
+
+                foreach (Entry entry in entries)
+                {
+                    if (entryType == EntryType.Credit) Task.Run(() => CreditAdded?.Invoke(this, new EntryEventArgs(a, entry)));
+                    else Task.Run(() => DebitAdded?.Invoke(this, new EntryEventArgs(a, entry)));
+                }
+            }
+        }
+
         private void LockAccount(string accountGuid)
         {
-            while (!_LockedAccounts.TryAdd(accountGuid, DateTime.Now.ToUniversalTime()))
+            int delayMs = _LockRetryMinimumMs;
+
+            while (!_LockedAccounts.TryAdd(accountGuid, DateTime.UtcNow))
             {
-                Task.Delay(100).Wait();
+                Thread.Sleep(delayMs);
+                delayMs = Math.Min(delayMs * 2, _LockRetryMaximumMs);
             }
         }
 
@@ -1,5 +1,6 @@
 ﻿using System;
 using System.Collections.Generic;
+using System.Text;
 using NetLedger;
 using Newtonsoft.Json;
 
@@ -89,6 +90,10 @@ namespace Test
                     {
                         CreditAdd();
                     }
+                    else if (subCmd.Equals("add many"))
+                    {
+                        CreditAddMany();
+                    }
                     else if (subCmd.Equals("pending"))
                     {
                         CreditsPending();
@@ -101,6 +106,10 @@ namespace Test
                     {
                         DebitAdd();
                     }
+                    else if (subCmd.Equals("add many"))
+                    {
+                        DebitAddMany();
+                    }
                     else if (subCmd.Equals("pending"))
                     {
                         DebitsPending();
@@ -127,36 +136,40 @@ namespace Test
 
         static void Menu()
         {
-            Console.WriteLine("--- Available Commands ---");
-            Console.WriteLine("");
-            Console.WriteLine(" General");
-            Console.WriteLine(" q                   quit");
-            Console.WriteLine(" ?                   help, this menu");
-            Console.WriteLine(" cls                 clear the screen");
-            Console.WriteLine("");
-            Console.WriteLine(" Accounts, i.e. acct [command]");
-            Console.WriteLine(" acct all            list all accounts, or search by name");
-            Console.WriteLine("      add            create an account");
-            Console.WriteLine("      by name        retrieve an account by name");
-            Console.WriteLine("      by guid        retrieve an account by GUID");
-            Console.WriteLine("      del by name    delete an account by name");
-            Console.WriteLine("      del by guid    delete an account by GUID");
-            Console.WriteLine("      balance        retrieve an account balance");
-            Console.WriteLine("      commit         commit pending entries to the balance");
-            Console.WriteLine("");
-            Console.WriteLine(" Credits, i.e. credit [command]");
-            Console.WriteLine(" credit add          add a credit to an account");
-            Console.WriteLine("        pending      list pending credits");
-            Console.WriteLine("");
-            Console.WriteLine(" Debits, i.e. debit [command]");
-            Console.WriteLine(" debit add           add a debit to an account");
-            Console.WriteLine("       pending       list pending debits");
-            Console.WriteLine("");
-            Console.WriteLine(" Entries, i.e. entry [command]");
-            Console.WriteLine(" entry pending       list pending entries");
-            Console.WriteLine("       search        search entries");
-            Console.WriteLine("       cancel        cancel a pending entry");
-            Console.WriteLine("");
+            StringBuilder sb = new StringBuilder();
+            sb.AppendLine("--- Available Commands ---");
+            sb.AppendLine("");
+            sb.AppendLine(" General");
+            sb.AppendLine(" q                   quit");
+            sb.AppendLine(" ?                   help, this menu");
+            sb.AppendLine(" cls                 clear the screen");
+            sb.AppendLine("");
+            sb.AppendLine(" Accounts, i.e. acct [command]");
+            sb.AppendLine(" acct all            list all accounts, or search by name");
+            sb.AppendLine("      add            create an account");
+            sb.AppendLine("      by name        retrieve an account by name");
+            sb.AppendLine("      by guid        retrieve an account by GUID");
+            sb.AppendLine("      del by name    delete an account by name");
+            sb.AppendLine("      del by guid    delete an account by GUID");
+            sb.AppendLine("      balance        retrieve an account balance");
+            sb.AppendLine("      commit         commit pending entries to the balance");
+            sb.AppendLine("");
+            sb.AppendLine(" Credits, i.e. credit [command]");
+            sb.AppendLine(" credit add          add a credit to an account");
+            sb.AppendLine("        add many     add multiple credits to an account");
+            sb.AppendLine("        pending      list pending credits");
+            sb.AppendLine("");
+            sb.AppendLine(" Debits, i.e. debit [command]");
+            sb.AppendLine(" debit add           add a debit to an account");
+            sb.AppendLine("       add many      add multiple debits to an account");
+            sb.AppendLine("       pending       list pending debits");
+            sb.AppendLine("");
+            sb.AppendLine(" Entries, i.e. entry [command]");
+            sb.AppendLine(" entry pending       list pending entries");
+            sb.AppendLine("       search        search entries");
+            sb.AppendLine("       cancel        cancel a pending entry");
+            sb.AppendLine("");
+            Console.Write(sb.ToString());
         }
 
         #region Account-APIs
@@ -269,6 +282,18 @@ namespace Test
             }
         }
 
+        static void CreditAddMany()
+        {
+            string guid = InputString("GUID:", _LastAccountGuid, true);
+            if (!String.IsNullOrEmpty(guid))
+            {
+                List<EntryInput> inputs = InputEntryList(false);
+                bool isCommitted = InputBoolean("Already Committed", false);
+                List<string> entryGuids = _Ledger.AddCredits(guid, inputs, isCommitted);
+                Console.WriteLine(SerializeJson(entryGuids, true));
+            }
+        }
+
         static void CreditsPending()
         {
             string guid = InputString("GUID:", _LastAccountGuid, true);
@@ -297,6 +322,18 @@ namespace Test
             }
         }
 
+        static void DebitAddMany()
+        {
+            string guid = InputString("GUID:", _LastAccountGuid, true);
+            if (!String.IsNullOrEmpty(guid))
+            {
+                List<EntryInput> inputs = InputEntryList(false);
+                bool isCommitted = InputBoolean("Already Committed", false);
+                List<string> entryGuids = _Ledger.AddDebits(guid, inputs, isCommitted);
+                Console.WriteLine(SerializeJson(entryGuids, true));
+            }
+        }
+
         static void DebitsPending()
         {
             string guid = InputString("GUID:", _LastAccountGuid, true);
@@ -369,44 +406,41 @@ namespace Test
 
         static void CreditAddedEvent(object sender, EntryEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Credit added event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Credit added event", args);
         }
 
         static void DebitAddedEvent(object sender, EntryEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Debit added event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Debit added event", args);
         }
 
         static void EntryCanceledEvent(object sender, EntryEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Entry canceled event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Entry canceled event", args);
         }
 
         static void AccountCreatedEvent(object sender, AccountEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Account created event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Account created event", args);
         }
 
         static void AccountDeletedEvent(object sender, AccountEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Account deleted event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Account deleted event", args);
         }
 
         static void EntriesCommittedEvent(object sender, CommitEventArgs args)
         {
-            Console.WriteLine("");
-            Console.WriteLine("Entries committed event:" + Environment.NewLine + SerializeJson(args, true));
-            Console.WriteLine("");
+            WriteEvent("Entries committed event", args);
+        }
+
+        static void WriteEvent(string description, object args)
+        {
+            Console.Write(
+                Environment.NewLine
+                + description + ":" + Environment.NewLine
+                + SerializeJson(args, true) + Environment.NewLine
+                + Environment.NewLine);
         }
 
         #endregion
@@ -595,6 +629,36 @@ namespace Test
             }
         }
 
+        static List<EntryInput> InputEntryList(bool allowEmpty)
+        {
+            List<EntryInput> ret = new List<EntryInput>();
+
+            while (true)
+            {
+                Console.Write("Amount:");
+
+                Console.Write(" ");
+
+                string userInput = Console.ReadLine();
+
+                if (String.IsNullOrEmpty(userInput))
+                {
+                    if (ret.Count < 1 && !allowEmpty) continue;
+                    return ret;
+                }
+
+                decimal val = 0;
+                if (!Decimal.TryParse(userInput, out val) || val < 0)
+                {
+                    Console.WriteLine("Please enter a valid decimal of zero or greater.");
+                    continue;
+                }
+
+                string notes = InputString("Notes:", null, true);
+                ret.Add(new EntryInput(val, notes));
+            }
+        }
+
         static List<string> InputStringList(string question, bool allowEmpty)
         {
             List<string> ret = new List<string>();